@@ -4,6 +4,7 @@
 
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api';
+import { healthQueryOptions, systemKeys } from '@/hooks/use-system';
 import type {
   AlertResponse,
   AlertDetailResponse,
@@ -82,20 +83,20 @@ export function useUpdateAlertStatus() {
       });
       // Invalidate lists to reflect status change
       queryClient.invalidateQueries({ queryKey: alertKeys.lists() });
+      // Refresh health snapshot so the pending count follows
+      queryClient.invalidateQueries({ queryKey: systemKeys.health });
     },
   });
 }
 
 /**
  * Get count of pending alerts (for dashboard)
+ * Reads alerts_pending from the health snapshot instead of downloading the
+ * full pending list; shares the health query so it adds no extra requests
  */
 export function usePendingAlertCount() {
   return useQuery({
-    queryKey: [...alertKeys.list({ status: 'PENDING' as AlertStatus, limit: 1 }), 'count'],
-    queryFn: async () => {
-      const alerts = await api.get<AlertResponse[]>('/api/v1/alerts?status=PENDING');
-      return alerts.length;
-    },
-    refetchInterval: 5000,
+    ...healthQueryOptions,
+    select: (health) => health.metrics?.alerts_pending,
   });
 }
@@ -6,6 +6,7 @@ import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import { useToast } from '@/hooks/use-toast';
 import { alertKeys } from '@/hooks/use-alerts';
+import { systemKeys } from '@/hooks/use-system';
 import type {
   DecisionRequest,
   DecisionResponse,
@@ -112,6 +113,7 @@ export function useCreateDecision(alertId: string) {
     onSettled: () => {
       queryClient.invalidateQueries({ queryKey: alertKeys.detail(alertId) });
       queryClient.invalidateQueries({ queryKey: alertKeys.lists() });
+      queryClient.invalidateQueries({ queryKey: systemKeys.health });
     },
   });
 }
@@ -2,7 +2,7 @@
 // System Hooks - Health check and rules data fetching
 // =============================================================================
 
-import { useQuery } from '@tanstack/react-query';
+import { queryOptions, useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import type { HealthResponse, RuleResponse } from '@/types/api';
 
@@ -16,6 +16,24 @@ export const systemKeys = {
   rule: (id: string) => ['system', 'rules', id] as const,
 };
 
+// -----------------------------------------------------------------------------
+// Query Options
+// -----------------------------------------------------------------------------
+
+/**
+ * Shared health query definition
+ * Hooks reading from the health snapshot must build on this so every observer
+ * of systemKeys.health uses the same fetcher and polling options
+ */
+export const healthQueryOptions = queryOptions({
+  queryKey: systemKeys.health,
+  queryFn: () => api.get<HealthResponse>('/api/v1/system/health', { skipAuth: true }),
+  refetchInterval: 5000, // Poll every 5 seconds
+  retry: 1,
+  // Don't show loading state on refetch to prevent status bar flicker
+  refetchOnWindowFocus: true,
+});
+
 // -----------------------------------------------------------------------------
 // Hooks
 // -----------------------------------------------------------------------------
@@ -25,14 +43,7 @@ export const systemKeys = {
  * Polls every 5 seconds for real-time status bar updates
  */
 export function useHealth() {
-  return useQuery({
-    queryKey: systemKeys.health,
-    queryFn: () => api.get<HealthResponse>('/api/v1/system/health', { skipAuth: true }),
-    refetchInterval: 5000, // Poll every 5 seconds
-    retry: 1,
-    // Don't show loading state on refetch to prevent status bar flicker
-    refetchOnWindowFocus: true,
-  });
+  return useQuery(healthQueryOptions);
 }
 
 /**